@@ -35,6 +35,47 @@ except ImportError:  # pragma: no cover
         __slots__ = ()
 
 
+try:
+    # 3.8 or greater
+    from functools import cached_property
+except ImportError:  # pragma: no cover
+    # <3.8 we create a simplified version of ``cached_property``, the value
+    # is stored in the instance ``__dict__``, which takes precedence over this
+    # (non-data) descriptor on subsequent lookups.
+
+    class cached_property(object):
+
+        def __init__(self, func):
+            self.func = func
+            self.attrname = func.__name__
+            self.__doc__ = func.__doc__
+
+        def __get__(self, instance, owner=None):
+            if instance is None:
+                return self
+            value = instance.__dict__[self.attrname] = self.func(instance)
+            return value
+
+
+try:
+    # 3.7 or greater
+    from contextlib import nullcontext
+except ImportError:  # pragma: no cover
+    # <3.7 we create a context manager that does nothing, other than return
+    # the ``enter_result`` from ``__enter__``.
+
+    class nullcontext(object):
+
+        def __init__(self, enter_result=None):
+            self.enter_result = enter_result
+
+        def __enter__(self):
+            return self.enter_result
+
+        def __exit__(self, *excinfo):
+            pass
+
+
 __all__ = (
-    'ContextManager',
+    'ContextManager', 'cached_property', 'nullcontext',
 )
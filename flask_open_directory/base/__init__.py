@@ -1,45 +1,64 @@
 # -*- coding: utf-8 -*-
 from typing import Union
+import threading
 from flask import _app_ctx_stack
 from contextlib import contextmanager
 import ldap3
 
 from .open_directory_abc import OpenDirectoryABC
+from .connection_pool import ConnectionPool
 from .. import utils
-from .._compat import ContextManager
+from .._compat import ContextManager, cached_property
 
 
-__all__ = ('OpenDirectoryABC', 'BaseOpenDirectory')
+__all__ = ('OpenDirectoryABC', 'BaseOpenDirectory', 'ConnectionPool')
 
 
 class BaseOpenDirectory(OpenDirectoryABC):
     """Implements the :class:`OpenDirectoryABC`.
 
     This stores all kwargs into a ``config`` attribute, which is used to
-    get the server url and an optional base dn.
+    get the server url, an optional base dn, and the connection pool settings.
 
     """
     _default_server = 'localhost'
     _default_base_dn = ''
+    _default_pool_size = 10
+    _default_pool_lifetime = 3600
+
+    _pool_lock = threading.Lock()
 
     def __init__(self, **config):
         self.config = config
+        self._pool = None
 
-    @property
+    def _invalidate(self) -> None:
+        """Clear the cached ``server_url`` and ``base_dn``.  This needs to
+        be called if the ``config`` is changed after either has been accessed.
+
+        """
+        self.__dict__.pop('server_url', None)
+        self.__dict__.pop('base_dn', None)
+
+    @cached_property
     def server_url(self) -> str:
         """Return the server url for an instance.  This looks in the ``config``
         dict for key 'OPEN_DIRECTORY_SERVER' and if noting is found it
         returns ``_default_server`` set on the class (default 'localhost').
 
+        The value is cached after the first access.
+
         """
         return self.config.get('OPEN_DIRECTORY_SERVER', self._default_server)
 
-    @property
+    @cached_property
     def base_dn(self) -> str:
         """Return the base dn for the open directory server.  This looks in the
         ``config`` dict for key 'OPEN_DIRECTORY_BASE_DN' and if nothing is found
         it will create one from the ``server_url``.
 
+        The value is cached after the first access.
+
         .. note::
             If your server url is an ip address, then you need to set this in
             the config.
@@ -69,11 +88,33 @@ class BaseOpenDirectory(OpenDirectoryABC):
             auto_bind=True
         )
 
+    @property
+    def pool(self) -> ConnectionPool:
+        """The :class:`ConnectionPool` of bound connections for an instance.
+        This is created on first access, using the 'OPEN_DIRECTORY_POOL_SIZE'
+        (default 10) and 'OPEN_DIRECTORY_POOL_LIFETIME' (default 3600 seconds)
+        keys in the ``config`` dict.
+
+        """
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    config = self.config
+                    self._pool = ConnectionPool(
+                        self.connect,
+                        size=config.get('OPEN_DIRECTORY_POOL_SIZE',
+                                        self._default_pool_size),
+                        lifetime=config.get('OPEN_DIRECTORY_POOL_LIFETIME',
+                                            self._default_pool_lifetime)
+                    )
+        return self._pool
+
     @property
     def connection(self) -> Union[None, ldap3.Connection]:
         """Return's a shared connection when a flask application is running.
         If there is not flask application running, then this property will
-        return ``None``.
+        return ``None``.  The shared connection is checked out from the
+        ``pool`` for the life of the application context.
 
         If you need a connection outside of a flask application context, then
         you can create one with the ``connect`` method or use the
@@ -83,19 +124,20 @@ class BaseOpenDirectory(OpenDirectoryABC):
         """
         ctx = _app_ctx_stack.top
         if ctx is not None:
-            if not hasattr(ctx, 'open_directory_connection'):
-                ctx.open_directory_connection = self.connect()
-            return ctx.open_directory_connection
+            connection = ctx.__dict__.get('open_directory_connection')
+            if connection is None:
+                connection = ctx.open_directory_connection = self.pool.get()
+            return connection
 
     @contextmanager
     def connection_ctx(self) -> ContextManager[ldap3.Connection]:
         """A context manager that will use the shared connection if a flask
-        application context is available if not it will create a connection
-        for running one-off commands.
+        application context is available if not it will checkout a connection
+        from the ``pool`` for running one-off commands.
 
         """
         if self.connection is not None:
             yield self.connection
         else:
-            with ldap3.Connection(self.create_server()) as connection:
+            with self.pool.connection() as connection:
                 yield connection
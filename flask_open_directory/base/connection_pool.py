@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+import queue
+import time
+import weakref
+from typing import Callable
+from contextlib import contextmanager
+import ldap3
+from ldap3.core.exceptions import LDAPException
+
+from .._compat import ContextManager
+
+
+class ConnectionPool(object):
+    """A thread-safe pool of bound :class:`ldap3.Connection`'s.  Connections
+    are bound once (using the ``factory``) and handed back out on subsequent
+    checkouts, which saves the ssl handshake and bind for every query.
+
+    :param factory:  A callable that returns a new bound
+                     :class:`ldap3.Connection`.
+    :param size:  The maximum number of idle connections to keep in the pool.
+    :param lifetime:  The number of seconds a connection is re-used for, before
+                      it is unbound and replaced with a fresh connection.
+
+    """
+    def __init__(self, factory: Callable[[], ldap3.Connection],
+                 size: int=10, lifetime: int=3600) -> None:
+        self.factory = factory
+        self.size = size
+        self.lifetime = lifetime
+        self._queue = queue.LifoQueue(maxsize=size)
+        self._expires = weakref.WeakKeyDictionary()
+
+    def _is_usable(self, connection: ldap3.Connection) -> bool:
+        """Helper to check if a connection is still bound and has not
+        out-lived the pool's ``lifetime``.
+
+        """
+        return connection.bound is True and \
+            self._expires.get(connection, 0) > time.monotonic()
+
+    def _discard(self, connection: ldap3.Connection) -> None:
+        """Helper to unbind a connection that is no longer kept in the pool.
+
+        """
+        self._expires.pop(connection, None)
+        try:
+            connection.unbind()
+        except LDAPException:  # pragma: no cover
+            pass
+
+    def get(self) -> ldap3.Connection:
+        """Checkout a connection from the pool, creating a new connection if
+        there are no idle connections available.
+
+        Connections returned from this method should be given back to the
+        pool with :meth:`put`.
+
+        """
+        while True:
+            try:
+                connection = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if self._is_usable(connection):
+                return connection
+            self._discard(connection)
+
+        connection = self.factory()
+        self._expires[connection] = time.monotonic() + self.lifetime
+        return connection
+
+    def put(self, connection: ldap3.Connection) -> None:
+        """Return a connection to the pool.  If the connection is no longer
+        bound, has expired, or the pool is already full, then the connection is
+        unbound instead.
+
+        """
+        if not self._is_usable(connection):
+            return self._discard(connection)
+        try:
+            self._queue.put_nowait(connection)
+        except queue.Full:
+            self._discard(connection)
+
+    @contextmanager
+    def connection(self) -> ContextManager[ldap3.Connection]:
+        """A context manager that checks out a connection for the duration of
+        the ``with`` block, and returns it to the pool afterwards.
+
+        If an :class:`ldap3.core.exceptions.LDAPException` is raised in the
+        ``with`` block, then the connection is unbound instead of being
+        returned to the pool, as it may no longer be usable.
+
+        """
+        connection = self.get()
+        failed = False
+        try:
+            yield connection
+        except LDAPException:
+            failed = True
+            raise
+        finally:
+            if failed is True:
+                self._discard(connection)
+            else:
+                self.put(connection)
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 import abc
+from itertools import chain
 from typing import Union
 from contextlib import contextmanager
 import ldap3
@@ -59,12 +60,8 @@ class OpenDirectoryABC(metaclass=abc.ABCMeta):
     @classmethod
     def __subclasshook__(cls, Cls):
         if cls is OpenDirectoryABC:
-            methods = [
-                any('server_url' in dir(B) for B in Cls.__mro__),
-                any('base_dn' in dir(B) for B in Cls.__mro__),
-                any('connection' in dir(B) for B in Cls.__mro__),
-                any('connection_ctx' in dir(B) for B in Cls.__mro__),
-            ]
-            if all(methods):
+            names = set(chain.from_iterable(B.__dict__ for B in Cls.__mro__))
+            if names.issuperset(('server_url', 'base_dn', 'connection',
+                                 'connection_ctx')):
                 return True
         return NotImplemented
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
-from typing import Any
+from typing import Any, Iterable, Set
 from functools import wraps
-from flask import current_app, abort
+from flask import current_app, abort, g
 from .utils import username_from_request
 from .model import Group
 
@@ -37,6 +37,33 @@ def _pass_open_directory(fn):
     return decorator
 
 
+def _member_of(open_directory, username: str,
+               group_names: Iterable[str]) -> Set[str]:
+    """Helper that returns the (lower cased) names, out of the
+    ``group_names``, of the groups the user is a member of.
+
+    The groups that have not been checked for the user yet are checked with a
+    single search, and the results are cached on :data:`flask.g`, so routes
+    and decorators in the same request don't search again.
+
+    """
+    cache = g.setdefault('open_directory_auth', {}).setdefault(username, {})
+    missing = [name for name in group_names if name.lower() not in cache]
+    if missing:
+        # the server matches any of a group's names (cn), so collect all of
+        # them for the found groups.
+        found = set()
+        query = open_directory.query()
+        for group in Group.groups_for_user(missing, username, query):
+            names = group.ldap_values.get('group_name')
+            if isinstance(names, str):
+                names = (names, )
+            found.update(str(name).lower() for name in names or ())
+        for name in missing:
+            cache[name.lower()] = name.lower() in found
+    return {name.lower() for name in group_names if cache[name.lower()]}
+
+
 def pass_context(fn):
     """Helper that passes a :class:`DecoratorContex` with the
     :class:`OpenDirectory` registered with the current application and the
@@ -96,8 +123,7 @@ def requires_group(group_name):
         def decorator(ctx, *args, **kwargs):
             od, username = ctx['open_directory'], ctx['username']
             if username is not None:
-                group = od.query(Group).filter(group_name=group_name).first()
-                if group and group.has_user(username):
+                if _member_of(od, username, (group_name, )):
                     return fn(*args, **kwargs)
                 return abort(401)
         return decorator
@@ -119,10 +145,10 @@ def _requires_groups(*group_names, _all=True):
         @pass_context
         def decorator(ctx, *args, **kwargs):
             od, username = ctx['open_directory'], ctx['username']
-            groups = [od.query(Group).filter(group_name=g).first() for g in
-                      group_names]
-            if test_fn(map(lambda g: g.has_user(username), groups)):
-                return fn(*args, **kwargs)
+            if username is not None:
+                member_of = _member_of(od, username, group_names)
+                if test_fn(name.lower() in member_of for name in group_names):
+                    return fn(*args, **kwargs)
             return abort(401)
         return decorator
     return inner
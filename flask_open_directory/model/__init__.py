@@ -1,3 +1,7 @@
+import copy
+from typing import Any, Iterable, Tuple
+from ldap3.utils.conv import escape_filter_chars
+
 from .model_abc import ModelABC
 from .model import BaseModel, Attribute
 
@@ -52,10 +56,53 @@ class Group(BaseModel):
                       a user.
 
         """
-        if self.users is not None:
-            if user in self.users:
-                return True
-        if self.member_ids is not None:
-            if user in self.member_ids:
+        for values in (self.users, self.member_ids):
+            if isinstance(values, str):
+                # a single value, check for an exact match (not a substring).
+                if user == values:
+                    return True
+            elif values is not None and user in values:
                 return True
         return False
+
+    @classmethod
+    def groups_for_user(cls, group_names: Iterable[str], user: str,
+                        query: Any) -> Tuple['Group']:
+        """Return the groups, out of the ``group_names``, that a user is part
+        of, using a single search.  The server does the membership check, so
+        only the group names are transferred.
+
+        :param group_names:  The group names (cn) of the groups to check.
+        :param user:  Either the username (uid) or id (apple-generateduid) of
+                      a user.
+        :param query:  The :class:`Query` to use for the search.  The query
+                       is copied for the search, so it is not changed.
+
+        """
+        group_names = tuple(group_names)
+        if len(group_names) == 0:
+            return ()
+        user = escape_filter_chars(str(user))
+        search_filter = '(&(|{})(|({}={})({}={})))'.format(
+            ''.join('({}={})'.format(cls.group_name.ldap_key,
+                                     escape_filter_chars(str(name)))
+                    for name in group_names),
+            cls.users.ldap_key, user,
+            cls.member_ids.ldap_key, user
+        )
+        query = copy.copy(query)
+        return query(cls).filter(search_filter).only('group_name').all()
+
+    @classmethod
+    def is_member(cls, group_name: str, user: str, query: Any) -> bool:
+        """Check if a user is part of a group, by letting the server do the
+        check.  This avoids transferring the members of the group.
+
+        :param group_name:  The group name (cn) of the group.
+        :param user:  Either the username (uid) or id (apple-generateduid) of
+                      a user.
+        :param query:  The :class:`Query` to use for the search.  The query
+                       is copied for the search, so it is not changed.
+
+        """
+        return len(cls.groups_for_user((group_name, ), user, query)) > 0
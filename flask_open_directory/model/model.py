@@ -1,6 +1,9 @@
 # -*- coding: utf-8 -*-
+import abc
+import copy
+from typing import Dict, Union, Iterable, Mapping, Any, Tuple
+import ldap3
 
-from typing import Dict, Union, Iterable
 from .model_abc import ModelABC
 
 
@@ -17,6 +20,9 @@ class Attribute(object):
     """Represents an LDAP entry attribute.  It maps the ldap entry key to an
     attribute on a Model.
 
+    This is a data descriptor, the values are stored in the ``ldap_values`` of
+    the model instance it is accessed on.
+
     :param ldap_key:  The ldap entry key for the attribute.
     :param allow_multiple:  If ``False`` (default) then any lists only return
                             the first item.  If ``True`` return the whole list
@@ -26,6 +32,24 @@ class Attribute(object):
     def __init__(self, ldap_key, allow_multiple=False):
         self.ldap_key = ldap_key
         self.allow_multiple = allow_multiple
+        # the python attribute name, set when assigned on a model class.
+        self.name = None
+
+    def __set_name__(self, owner, name) -> None:
+        self.name = name
+
+    def __get__(self, instance, owner) -> Union[Iterable[str], str, None]:
+        if instance is None:
+            return self
+        # return the ldap value or ``None`` if it's not set yet.
+        value = instance.ldap_values.get(self.name)
+        if value and self.allow_multiple is False:
+            if isinstance(value, list) and len(value) > 0:
+                return value[0]
+        return value
+
+    def __set__(self, instance, value) -> None:
+        instance.ldap_values[self.name] = value
 
     def __str__(self):
         return str(self.ldap_key)
@@ -38,7 +62,39 @@ class Attribute(object):
         )
 
 
-class BaseModel(ModelABC):
+class _ModelMeta(abc.ABCMeta):
+    """Metaclass for :class:`BaseModel`, which collects the :class:`Attribute`
+    instances (including inherited ones) of a class once, when the class is
+    created, instead of every time an attribute is accessed.
+
+    """
+    def __init__(cls, name, bases, namespace):
+        super().__init__(name, bases, namespace)
+        for key, value in namespace.items():
+            # ``__set_name__`` is not called automatically for python < 3.6
+            if isinstance(value, Attribute) and value.name is None:
+                value.__set_name__(cls, key)
+
+        attrs = {}
+        for klass in reversed(cls.__mro__):
+            for key, value in vars(klass).items():
+                if isinstance(value, Attribute):
+                    attrs[key] = value
+                else:
+                    # a subclass can replace an inherited ``Attribute``.
+                    attrs.pop(key, None)
+
+        cls._attr_items = tuple(attrs.items())
+        cls._attr_by_name = attrs
+        cls._attr_keys = frozenset(attrs)
+        cls._attr_map = {k: v.ldap_key for (k, v) in cls._attr_items}
+        cls._reverse_attr_map = {v.ldap_key: k for (k, v) in cls._attr_items}
+        cls._multi = frozenset(k for (k, v) in cls._attr_items
+                               if v.allow_multiple)
+        cls._ldap_keys = tuple(v.ldap_key for (_, v) in cls._attr_items)
+
+
+class BaseModel(ModelABC, metaclass=_ModelMeta):
     """Implementation of :class:`ModelABC`.  Used to map ldap entry keys to
     python attributes.
 
@@ -61,6 +117,12 @@ class BaseModel(ModelABC):
 
 
     """
+    def __new__(cls, *args, **kwargs):
+        obj = super().__new__(cls)
+        # create the internal storage up front, bypassing ``__setattr__``.
+        obj.__dict__['_ldap_values'] = {}
+        return obj
+
     def __init__(self, **kwargs):
         for key, value in kwargs.items():
             setattr(self, key, value)
@@ -70,7 +132,7 @@ class BaseModel(ModelABC):
         """Returns the :class:`Attribute` instances on a class
 
         """
-        return (v for v in vars(cls).values() if isinstance(v, Attribute))
+        return (v for (_, v) in cls._attr_items)
 
     @classmethod
     def attribute_for_key(cls, key: str) -> Union[Attribute, None]:
@@ -80,20 +142,140 @@ class BaseModel(ModelABC):
         Returns ``None`` if not found
 
         """
-        if key in cls.ldap_attribute_map().values():
-            key = cls.attribute_name_for(key)
-        return next((v for (k, v) in vars(cls).items() if k == key), None)
+        return cls._attr_by_name.get(cls._reverse_attr_map.get(key, key))
+
+    @classmethod
+    def _values_from_mapping(cls, mapping: Mapping[str, Any]
+                             ) -> Dict[str, Union[str, Iterable[str]]]:
+        """Helper to create the ``ldap_values`` from a mapping, whose keys are
+        the python attribute names or the ldap entry keys.  Any keys that are
+        not an :class:`Attribute` on the class are ignored.
+
+        """
+        keys, reverse = cls._attr_keys, cls._reverse_attr_map
+        return {
+            (k if k in keys else reverse[k]): v for (k, v) in mapping.items()
+            if k in keys or k in reverse
+        }
+
+    @classmethod
+    def _from_mapping(cls, mapping: Mapping[str, Any]) -> 'BaseModel':
+        """Helper to create an instance from a mapping, whose keys are the
+        python attribute names or the ldap entry keys.  This fills the
+        ``ldap_values`` in one pass, without calling ``__init__``.
+
+        """
+        obj = cls.__new__(cls)
+        obj.__dict__['_ldap_values'] = cls._values_from_mapping(mapping)
+        return obj
+
+    @classmethod
+    def from_entry(cls, entry: ldap3.Entry) -> 'BaseModel':
+        """Return an instance of the class from an :class:`ldap3.Entry`.
+
+        This does not call ``__init__``, so subclasses that need custom
+        initialization should override this method.
+
+        :param entry:  An :class:`ldap3.Entry` to convert to this python model.
+
+        """
+        return cls._from_mapping(entry.entry_attributes_as_dict)
+
+    @classmethod
+    def from_entry_lazy(cls, entry: ldap3.Entry) -> 'BaseModel':
+        """Return an instance of the class that holds on to the
+        :class:`ldap3.Entry`, and only converts it's values the first time
+        they are accessed.
+
+        This is useful for large queries, where only a few of the instances
+        or attributes are used.
+
+        :param entry:  An :class:`ldap3.Entry` to convert to this python model.
+
+        """
+        obj = cls.__new__(cls)
+        obj.__dict__['_entry'] = entry
+        obj.__dict__['_ldap_values'] = None
+        return obj
+
+    @classmethod
+    def from_entry_batch(cls, columns: Mapping[str, Iterable[Any]]
+                         ) -> Tuple['BaseModel']:
+        """Return a tuple of instances of the class from a columnar mapping,
+        whose keys are the python attribute names or the ldap entry keys, and
+        whose values are a list of the values for each instance (as returned
+        from :meth:`BaseQuery.all_soa`).
+
+        Any keys that are not an :class:`Attribute` on the class are ignored.
+        Like :meth:`from_entry`, this does not call ``__init__``.
+
+        :param columns:  The columnar mapping to convert to this python model.
+
+        """
+        keys, reverse = cls._attr_keys, cls._reverse_attr_map
+        names, values, count = [], [], 0
+        for (key, column) in columns.items():
+            column = tuple(column)
+            count = len(column)
+            if key in keys or key in reverse:
+                names.append(key if key in keys else reverse[key])
+                values.append(column)
+
+        rows = zip(*values) if values else ((), ) * count
+        new = cls.__new__
+        rv = []
+        for row in rows:
+            obj = new(cls)
+            obj.__dict__['_ldap_values'] = dict(zip(names, row))
+            rv.append(obj)
+        return tuple(rv)
+
+    @classmethod
+    def get_many(cls, key: str, values: Iterable[str],
+                 query: Any) -> Tuple['BaseModel']:
+        """Return all the instances whose ``key`` matches any of the
+        ``values``, using a single search.  Returns an empty tuple, without
+        searching, if there are no ``values``.
+
+        :param key:  The python attribute name or the ldap entry key to match.
+        :param values:  The values to match.
+        :param query:  The :class:`Query` to use for the search.  The query
+                       is copied for the search, so it is not changed.
+
+        """
+        values = tuple(values)
+        if len(values) == 0:
+            return ()
+        return copy.copy(query)(cls).filter_in(key, values).all()
+
+    @classmethod
+    def attribute_name_for(cls, ldap_key: str) -> Union[None, str]:
+        """Retrieve the python attribute name for a given ldap entry key, or
+        ``None`` if not found.
+
+        :param ldap_key:  The ldap entry key.
+
+        """
+        return cls._reverse_attr_map.get(str(ldap_key))
 
     @classmethod
     def ldap_attribute_map(cls) -> Dict[str, str]:
         """Returns the mapping between python attributes and ldap entry keys.
 
         The python attribute name is the key and ldap entry key is the value
-        in the mapping.
+        in the mapping.  The mapping is built once when the class is created,
+        so it should not be mutated.
+
+        """
+        return cls._attr_map
+
+    @classmethod
+    def ldap_keys(cls) -> Tuple[str]:
+        """Return all the ldap keys.  The keys are collected once when the
+        class is created.
 
         """
-        return {k: v.ldap_key for (k, v) in vars(cls).items()
-                if isinstance(v, Attribute)}
+        return cls._ldap_keys
 
     @property
     def ldap_values(self) -> Dict[str, Union[str, Iterable[str]]]:
@@ -102,9 +284,20 @@ class BaseModel(ModelABC):
         on a Model.
 
         """
-        if not getattr(self, '_ldap_values', None):
-            self._ldap_values = {}
-        return self._ldap_values
+        values = self._ldap_values
+        if values is None:
+            values = self._ensure()
+        return values
+
+    def _ensure(self) -> Dict[str, Union[str, Iterable[str]]]:
+        """Helper to convert the entry of an instance created with
+        :meth:`from_entry_lazy` into the internal storage.
+
+        """
+        entry = self.__dict__.pop('_entry')
+        values = self._values_from_mapping(entry.entry_attributes_as_dict)
+        self.__dict__['_ldap_values'] = values
+        return values
 
     def _get_ldap_value(self, key) -> Union[Iterable[str], str, None]:
         """Helper to get the internal value (if available) from the internal
@@ -112,49 +305,39 @@ class BaseModel(ModelABC):
 
         """
         value = self.ldap_values.get(key)
-        if value and object.__getattribute__(self, key).allow_multiple is False:
-            if isinstance(value, list) and len(value) > 0:
-                return value[0]
+        if key not in type(self)._multi and isinstance(value, list) and value:
+            return value[0]
         return value
 
     def __setattr__(self, key, value) -> None:
-        """Properly set the :class:`Attribute` values in the internal storage,
-        or fallback to the default implementation.
-
-        """
-        if key in self.ldap_attribute_map().keys():
-            self.ldap_values[key] = value
-        elif key in self.ldap_attribute_map().values():
-            self.ldap_values[self.attribute_name_for(key)] = value
-        else:
-            super().__setattr__(key, value)
-
-    def __getattribute__(self, key):
-        """Retrieve the appropriate values for an attribute, possibly from
-        the internal storage, if the attribute being accessed is a
-        :class:`Attribute`.
-
-        """
-        ldap_key = None
-        attr_map = object.__getattribute__(self, 'ldap_attribute_map')()
-        if key in attr_map.keys():
-            ldap_key = key
-        elif key in attr_map.values():
-            ldap_key = object.__getattribute__(self, 'attribute_name_for')(key)
-        if ldap_key is not None:
-            # return the ldap value or ``None`` if it's not set yet.
-            return object.__getattribute__(self, '_get_ldap_value')(ldap_key)
-        # fallback to default
-        return object.__getattribute__(self, key)
+        """Allows setting an :class:`Attribute` value by it's ldap entry key,
+        everything else is handled by the default implementation.
+
+        """
+        cls = type(self)
+        if key not in cls._attr_keys:
+            key = cls._reverse_attr_map.get(key, key)
+        super().__setattr__(key, value)
+
+    def __getattr__(self, key):
+        """Allows retrieving an :class:`Attribute` value by it's ldap entry
+        key.  This is only called when normal attribute lookup fails.
+
+        """
+        name = type(self)._reverse_attr_map.get(key)
+        if name is None:
+            raise AttributeError(key)
+        return getattr(self, name)
 
     def __repr__(self) -> str:
-        rv = '{}('.format(self.__class__.__name__)
-        attr_strs = map(
-            lambda key: "{}={}".format(
-                key,
-                _quote_if_str(self._get_ldap_value(key))
-            ),
-            self.ldap_attribute_map().keys()
-        )
-        rv += ', '.join(attr_strs) + ')'
-        return rv
+        """Show the attributes that have a value set, in the order they are
+        declared on the class.
+
+        """
+        values = self.ldap_values
+        attr_strs = [
+            "{}={}".format(key, _quote_if_str(self._get_ldap_value(key)))
+            for (key, _) in type(self)._attr_items
+            if values.get(key) is not None
+        ]
+        return '{}({})'.format(type(self).__name__, ', '.join(attr_strs))
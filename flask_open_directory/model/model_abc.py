@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 import abc
+from itertools import chain
 from typing import Dict, Union, Tuple, Any
 import ldap3
 
@@ -97,13 +98,8 @@ class ModelABC(metaclass=abc.ABCMeta):
     @classmethod
     def __subclasshook__(cls, Cls):
         if cls is ModelABC:
-            methods = [
-                any('ldap_attribute_map' in dir(B) for B in Cls.__mro__),
-                any('attribute_name_for' in dir(B) for B in Cls.__mro__),
-                any('query_cn' in dir(B) for B in Cls.__mro__),
-                any('from_entry' in dir(B) for B in Cls.__mro__),
-                any('ldap_keys' in dir(B) for B in Cls.__mro__),
-            ]
-            if all(methods):
+            names = set(chain.from_iterable(B.__dict__ for B in Cls.__mro__))
+            if names.issuperset(('ldap_attribute_map', 'attribute_name_for',
+                                 'query_cn', 'from_entry', 'ldap_keys')):
                 return True
         return NotImplemented  # pragma: no cover
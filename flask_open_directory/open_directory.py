@@ -34,6 +34,7 @@ class OpenDirectory(BaseOpenDirectory):
 
         """
         self.config.update(app.config)
+        self._invalidate()
 
         if not hasattr(app, 'extensions'):
             app.extensions = {}  # pragma: no cover
@@ -46,14 +47,15 @@ class OpenDirectory(BaseOpenDirectory):
             app.teardown_request(self.teardown)  # pragma: no cover
 
     def teardown(self, exception):
-        """Clean-up for the extension.
+        """Clean-up for the extension.  Returns the shared connection to the
+        ``pool``.
 
         """
         ctx = _app_ctx_stack.top
         if ctx is not None:
-            if hasattr(ctx, 'open_directory_connection'):
-                ctx.open_directory_connection.unbind()
-                del(ctx.open_directory_connection)
+            connection = ctx.__dict__.pop('open_directory_connection', None)
+            if connection is not None:
+                self.pool.put(connection)
 
     def query(self, model=None, **kwargs) -> Query:
         """Create a query with this instance as it's ``open_directory``
@@ -1,26 +1,12 @@
 # -*- coding: utf-8 -*-
-from typing import Union
-from functools import wraps
-import collections
+from typing import Union, Iterable
 
 from .query_abc import QueryABC
-from .base_query import BaseQuery
+from .base_query import BaseQuery, _any_filter
 
 __all__ = ('QueryABC', 'Query', 'BaseQuery')
 
 
-def chainable_method(fn):
-    """Marks a method to always return self/class regardless of wrapped
-    method's output.
-
-    """
-    @wraps(fn)
-    def decorator(self, *args, **kwargs):
-        fn(self, *args, **kwargs)
-        return self
-    return decorator
-
-
 class Query(BaseQuery):
     """Extends the :class:`BaseQuery` with some helper methods.  The helpers
     typically return the query when called for method chaining.
@@ -43,31 +29,29 @@ class Query(BaseQuery):
         Group(...)
 
     """
+    __slots__ = ()
+
     def _parse_filter_kwargs(self, kwargs):
         """Helper to yield '(key=value)' strings from kwargs.  This method also
         parses the key with the ``model`` attribute of an instance to get the
         correct key to use in the query.
 
         """
-        if len(kwargs) > 0 and isinstance(kwargs, collections.Mapping):
-            for key, value in kwargs.items():
-                if self.model is not None:
-                    mkey = self.model.attribute_for_key(key).ldap_key
-                    if mkey is not None:
-                        key = mkey
-                yield '({}={})'.format(key, value)
+        attr_map = {}
+        if kwargs and self.model is not None:
+            attr_map = self.model.ldap_attribute_map() or attr_map
+        for key, value in kwargs.items():
+            yield '({}={})'.format(attr_map.get(key, key), value)
 
     def _filter_string_from_kwargs(self, kwargs) -> Union[str, None]:
         """Helper to create the filter string from kwargs.
 
         """
-        parsed = tuple(self._parse_filter_kwargs(kwargs))
-        if len(parsed) > 1:
-            return '(&' + ''.join(parsed) + ')'
-        elif len(parsed) == 1:
-            return parsed[0]
+        parsed = ''.join(self._parse_filter_kwargs(kwargs))
+        if len(kwargs) > 1:
+            return '(&' + parsed + ')'
+        return parsed or None
 
-    @chainable_method
     def filter(self, *args, **kwargs) -> 'Query':
         """Set's the search filter for an instance, returning the query for
         method chaining.
@@ -105,10 +89,54 @@ class Query(BaseQuery):
         if string is None and len(kwargs) > 0:
             string = self._filter_string_from_kwargs(kwargs)
         self.search_filter = string
+        return self
+
+    def filter_in(self, key: str, values: Iterable[str]) -> 'Query':
+        """Set's the search filter for an instance to match any of the
+        ``values`` for the ``key``, returning the query for method chaining.
+
+        This allows looking up several entries with a single search, instead
+        of a search per value.  The key can be the model's attribute name or
+        the ldap entry key, and the values are escaped.
+
+        :raises ValueError:  If there are no ``values``.  The search filter is
+                             not changed.
+
+        :Example:
+
+            >>> q = Query(model=Group).filter_in('group_name', ('a', 'b'))
+            >>> q.search_filter
+            '(|(cn=a)(cn=b))'
+
+        """
+        if self.model is not None:
+            key = self.model.ldap_attribute_map().get(key, key)
+        self.search_filter = _any_filter(key, values)
+        return self
+
+    def only(self, *names) -> 'Query':
+        """Narrow the ldap attributes returned by the server for the query,
+        returning the query for method chaining.
+
+        By default a query asks for all the ``ldap_keys`` of the ``model``.
+        The names can be the model's attribute names or the ldap entry keys.
+
+        :Example:
+
+            >>> q = Query(model=User).only('username', 'mail')
+            >>> q.ldap_attributes
+            ('uid', 'mail')
+
+        """
+        if self.model is not None:
+            attr_map = self.model.ldap_attribute_map()
+            names = (attr_map.get(name, name) for name in names)
+        self.ldap_attributes = names
+        return self
 
-    @chainable_method
     def __call__(self, model) -> 'Query':
         """Set/change the model for an instance.
 
         """
         self.model = model
+        return self
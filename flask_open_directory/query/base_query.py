@@ -1,12 +1,18 @@
 # -*- coding: utf-8 -*-
-from typing import Union, Iterable, Any, Tuple
+from typing import (Union, Iterable, Any, Tuple, Hashable, Dict, Callable,
+                    List)
+from collections import OrderedDict
 from contextlib import contextmanager
+import copy
+import threading
+import time
 import ldap3
+from ldap3.utils.conv import escape_filter_chars
 
 from .query_abc import QueryABC
 from ..model import ModelABC
 from ..base import OpenDirectoryABC
-from .._compat import ContextManager
+from .._compat import ContextManager, nullcontext
 
 
 ConnectionCtx = ContextManager[Union[None, ldap3.Connection]]
@@ -21,6 +27,138 @@ def _quote_if_str(val):
     return val
 
 
+class _ResultCache(object):
+    """A thread-safe, size bounded (least recently used) cache for search
+    results, where each result expires after a timeout.
+
+    """
+    def __init__(self, maxsize: int=512) -> None:
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Union[None, Tuple['_CachedEntry']]:
+        """Return the cached result for the key, or ``None`` if it's not
+        cached or has expired.
+
+        """
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires, value = item
+            if expires <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Tuple['_CachedEntry'],
+            timeout: float) -> None:
+        """Cache a result for ``timeout`` seconds.
+
+        """
+        with self._lock:
+            self._data[key] = (time.monotonic() + timeout, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all the cached results.
+
+        """
+        with self._lock:
+            self._data.clear()
+
+
+_result_cache = _ResultCache()
+
+
+class _CachedEntry(object):
+    """A snapshot of an :class:`ldap3.Entry`'s dn and attribute values, used
+    for the cached search results.  This does not hold on to the entry (and
+    it's connection), and every access of ``entry_attributes_as_dict``
+    returns new lists, so the cached values can not be changed.
+
+    """
+    __slots__ = ('entry_dn', '_values')
+
+    def __init__(self, entry: ldap3.Entry) -> None:
+        self.entry_dn = entry.entry_dn
+        self._values = tuple(
+            (k, tuple(v)) for (k, v) in entry.entry_attributes_as_dict.items()
+        )
+
+    @property
+    def entry_attributes_as_dict(self) -> Dict[str, List[Any]]:
+        return {k: list(v) for (k, v) in self._values}
+
+    def __repr__(self) -> str:
+        return '{}({!r})'.format(type(self).__name__, self.entry_dn)
+
+
+def _any_filter(key: str, values: Iterable[Any]) -> str:
+    """Helper to create a filter string that matches any of the ``values``
+    for the ``key``.  The values are escaped.
+
+    :raises ValueError:  If there are no ``values``, as an empty ``'(|)'``
+                         filter is rejected by ldap3.
+
+    """
+    parsed = tuple('({}={})'.format(key, escape_filter_chars(str(v)))
+                   for v in values)
+    if len(parsed) == 0:
+        raise ValueError('At least one value is required for: {}'.format(key))
+    if len(parsed) == 1:
+        return parsed[0]
+    return '(|' + ''.join(parsed) + ')'
+
+
+# the oid of the ldap simple paged results control.
+_PAGED_RESULTS = '1.2.840.113556.1.4.319'
+
+
+def _search(connection: ldap3.Connection, search_base: str,
+            search_filter: str, attributes: Iterable[str],
+            page_size: int=None) -> Iterable[ldap3.Entry]:
+    """Helper that searches the connection and yields the
+    :class:`ldap3.Entry`'s that have values.
+
+    If a ``page_size`` is given, then the server returns the results in pages
+    of that size, and the next page is only requested once the entries of the
+    current page have been consumed.
+
+    """
+    cookie = None
+    while True:
+        connection.search(search_base, search_filter, attributes=attributes,
+                          paged_size=page_size, paged_cookie=cookie)
+        entries = connection.entries
+        # read the cookie before yielding, as the consumer could run another
+        # search on the same connection, which replaces it's result.
+        cookie = None
+        if page_size:
+            try:
+                cookie = connection.result['controls'][_PAGED_RESULTS][
+                    'value']['cookie']
+            except (KeyError, TypeError):
+                pass
+
+        for entry in entries:
+            # check the entries have values. All attributes get returned
+            # as a list, so we check that any of the lists are non-empty
+            # (truthy).  This is useful, because when using the ``all``
+            # method, without any filter criteria, the first record is
+            # always empty lists.
+            values = entry.entry_attributes_as_dict.values()
+            if any(values):
+                yield entry
+
+        if not cookie:
+            return
+
+
 class BaseQuery(QueryABC):
     """Implementation of :class:`QueryABC` abstract class.  This is used to
     search an ldap connection and convert the entries into a :class:`ModelABC`
@@ -31,10 +169,32 @@ class BaseQuery(QueryABC):
     try to create a connection with the ``open_directory`` set on the instance
     for the search.
 
+    Searches request the results from the server in pages of ``_page_size``
+    entries (500 by default), set it to ``None`` on the class to disable
+    paging.
+
+    Search results can be cached, by setting ``_cache_timeout`` on the class
+    to the number of seconds to keep results for.  Caching is disabled by
+    default, and the cache can be cleared with :meth:`invalidate_cache`.
+    Results are cached for each server and bind identity, as snapshots of the
+    entries' values, so unconverted results are not :class:`ldap3.Entry`'s
+    when caching is enabled.
+
     """
+    __slots__ = ('_search_base', '_search_filter', '_ldap_attributes',
+                 '_connection', '_model', '_open_directory',
+                 '_cached_search_base', '_cached_attrs')
+
     # used if no search filter is set on an instance.
     _default_search_filter = '(objectClass=*)'
 
+    # seconds to cache search results for, ``0`` disables the cache.
+    _cache_timeout = 0
+
+    # number of entries per page requested from the server, ``None`` disables
+    # paging.
+    _page_size = 500
+
     def __init__(self, open_directory: Any=None,
                  model: Any=None,
                  search_base: str=None,
@@ -43,6 +203,12 @@ class BaseQuery(QueryABC):
                  ldap_attributes: Iterable[str]=None
                  ) -> None:
 
+        # initialize the backing fields, so the getters can read them
+        # directly.
+        self._search_base = self._search_filter = self._ldap_attributes = None
+        self._connection = self._model = self._open_directory = None
+        self._cached_search_base = self._cached_attrs = None
+
         self.search_base = search_base
         self.search_filter = search_filter
         self.connection = connection
@@ -59,7 +225,7 @@ class BaseQuery(QueryABC):
         but we always store a reference to the class.
 
         """
-        return getattr(self, '_model', None)
+        return self._model
 
     @model.setter
     def model(self, value) -> None:
@@ -70,6 +236,8 @@ class BaseQuery(QueryABC):
                 self._model = value
             else:
                 raise TypeError()
+            self._cached_search_base = None
+            self._cached_attrs = None
 
     @property
     def open_directory(self) -> Any:
@@ -77,13 +245,14 @@ class BaseQuery(QueryABC):
         query.
 
         """
-        return getattr(self, '_open_directory', None)
+        return self._open_directory
 
     @open_directory.setter
     def open_directory(self, value) -> None:
         if value is not None:
             if isinstance(value, OpenDirectoryABC):
                 self._open_directory = value
+                self._cached_search_base = None
             else:
                 raise TypeError(value)
 
@@ -100,36 +269,47 @@ class BaseQuery(QueryABC):
         check if a ``model`` has been set for the instance and we will add it's
         ``query_cn``.
 
+        The derived value is cached, until the ``model`` or ``open_directory``
+        is changed.
 
         """
-        search_base = getattr(self, '_search_base', None)
+        search_base = self._search_base
         if search_base is None:
-            od_base = None
-            try:
-                od_base = self.open_directory.base_dn
-            except AttributeError:
-                pass
-
-            model_cn = None
-            try:
-                model_cn = self.model.query_cn()
-            except AttributeError:
-                pass
+            search_base = self._cached_search_base
+            if search_base is None:
+                search_base = self._derive_search_base()
+                self._cached_search_base = search_base
+        return search_base
 
-            if model_cn is not None and od_base is not None:
-                if "cn=" not in model_cn:
-                    search_base = 'cn={},{}'.format(model_cn, od_base)
-                else:
-                    search_base = model_cn + ',{}'.format(od_base)
-            elif od_base is not None:
-                search_base = od_base
+    def _derive_search_base(self) -> Union[str, None]:
+        """Helper to derive the ``search_base`` from the ``open_directory``
+        and the ``model`` of an instance.
 
-        return search_base
+        """
+        od_base = None
+        try:
+            od_base = self.open_directory.base_dn
+        except AttributeError:
+            pass
+
+        model_cn = None
+        try:
+            model_cn = self.model.query_cn()
+        except AttributeError:
+            pass
+
+        if model_cn is not None and od_base is not None:
+            fmt = '{},{}' if 'cn=' in model_cn else 'cn={},{}'
+            return fmt.format(model_cn, od_base)
+        return od_base
 
     @search_base.setter
     def search_base(self, value) -> None:
         if value is not None:
-            self._search_base = str(value)
+            if type(value) is not str:
+                value = str(value)
+            self._search_base = value
+            self._cached_search_base = None
 
     @property
     def search_filter(self) -> str:
@@ -137,15 +317,17 @@ class BaseQuery(QueryABC):
         return the class's ``_default_search_filter`` which is '(objectClass=*)'
 
         """
-        search_filter = getattr(self, '_search_filter', None)
+        search_filter = self._search_filter
         if search_filter is not None:
-            return str(search_filter)
+            return search_filter
         return self._default_search_filter
 
     @search_filter.setter
     def search_filter(self, value) -> None:
         if value is not None:
-            self._search_filter = str(value)
+            if type(value) is not str:
+                value = str(value)
+            self._search_filter = value
 
     @property
     def ldap_attributes(self) -> Union[None, Iterable[str]]:
@@ -155,24 +337,29 @@ class BaseQuery(QueryABC):
         If none have been set explicitly on an instance, then we will check if
         there is a ``model``, and use it's ``ldap_keys`` for this value.
 
+        The value is stored as a tuple, and the one derived from the ``model``
+        is cached until the ``model`` is changed.
+
         """
-        attrs = getattr(self, '_ldap_attributes', None)
+        attrs = self._ldap_attributes
         if attrs is None:
-            try:
-                attrs = self.model.ldap_keys()
-            except AttributeError:
-                pass
-        if attrs is not None:
-            return tuple(attrs)
+            attrs = self._cached_attrs
+            if attrs is None:
+                try:
+                    attrs = self.model.ldap_keys()
+                except AttributeError:
+                    return None
+                attrs = self._cached_attrs = tuple(attrs)
+        return attrs
 
     @ldap_attributes.setter
     def ldap_attributes(self, value) -> None:
         if value is not None:
             if not isinstance(value, str):
-                self._ldap_attributes = [s for s in iter(value)
-                                         if isinstance(s, str)]
+                self._ldap_attributes = tuple(s for s in iter(value)
+                                              if isinstance(s, str))
             else:
-                self._ldap_attributes = [value]
+                self._ldap_attributes = (value, )
 
     @property
     def connection(self) -> ConnectionCtx:
@@ -189,7 +376,7 @@ class BaseQuery(QueryABC):
                             an :class:`ldap3.Connection`.
 
         """
-        connection = getattr(self, '_connection', None)
+        connection = self._connection
         if connection is None:
             try:
                 connection = self.open_directory.connection
@@ -232,29 +419,42 @@ class BaseQuery(QueryABC):
     def _query(self, connection) -> Iterable[ldap3.Entry]:
         """Helper that performs the query and yields :class:`ldap3.Entry`'s
 
+        A ``connection`` passed in is used directly, without changing the
+        ``connection`` of an instance.
+
         """
         if connection is not None:
-            self.connection = connection
+            ctx = nullcontext(connection)
+        else:
+            ctx = self.connection_ctx()
 
-        with self.connection_ctx() as conn:
+        with ctx as conn:
             if conn is not None:
-                conn.search(
-                    self.search_base,
-                    self.search_filter,
-                    attributes=self.ldap_attributes
-                )
-                for entry in conn.entries:
-                    # check the entries have values. All attributes get returned
-                    # as a list, so we check that the list has a length greater
-                    # than 0.  This is useful, because when using the ``all``
-                    # method, without any filter criteria, the first record is
-                    # always empty lists.
-                    if any(map(lambda x: len(x) > 0,
-                               entry.entry_attributes_as_dict.values())):
-                        yield entry
+                args = (self.search_base, self.search_filter,
+                        self.ldap_attributes, self._page_size)
+                timeout = self._cache_timeout
+                if timeout:
+                    # results depend on who the connection is bound as.
+                    key = (conn.server.name, conn.user,
+                           conn.authentication) + args
+                    entries = _result_cache.get(key)
+                    if entries is None:
+                        entries = tuple(map(_CachedEntry,
+                                            _search(conn, *args)))
+                        _result_cache.set(key, entries, timeout)
+                    yield from entries
+                else:
+                    yield from _search(conn, *args)
             # We should probably raise a connection error of some
             # sort here.
 
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """Clear all the cached search results.
+
+        """
+        _result_cache.clear()
+
     def first(self, connection: ldap3.Connection=None, convert=True) -> Any:
         """Query the connection and return the first item found for the current
         state of the query.  This will return ``None`` if a connection was not
@@ -267,12 +467,13 @@ class BaseQuery(QueryABC):
 
         """
         entry = next(self._query(connection), None)
-        if convert is True and self.model is not None:
-            return self.model.from_entry(entry)
+        model = self.model
+        if entry is not None and convert is True and model is not None:
+            return model.from_entry(entry)
         return entry
 
-    def all(self, connection: ldap3.Connection=None, convert=True
-            ) -> Tuple[Any]:
+    def all(self, connection: ldap3.Connection=None, convert=True,
+            lazy=False) -> Tuple[Any]:
         """Query the connection and return a tuple of all items found for the
         current state of the query.  This will return an empty tuple if a
         connection was not established or there was no entries to match the
@@ -282,19 +483,180 @@ class BaseQuery(QueryABC):
                             search.
         :param convert:  Whether to convert the :class:`ldap3.Entry`'s to the
                          ``model`` set on a class.  Default is ``True``
+        :param lazy:  Whether to defer converting the :class:`ldap3.Entry`'s
+                      until the values of a model are accessed, if the
+                      ``model`` supports it (has a ``from_entry_lazy``
+                      method).  Default is ``False``
+
+        """
+        entries = self._query(connection)
+        model = self.model
+        if convert is True and model is not None:
+            from_entry = model.from_entry
+            if lazy is True:
+                from_entry = getattr(model, 'from_entry_lazy', from_entry)
+            return tuple(map(from_entry, entries))
+        return tuple(entries)
+
+    def all_soa(self, connection: ldap3.Connection=None
+                ) -> Dict[str, List[Any]]:
+        """Query the connection and return the values of all the entries found
+        in a columnar layout, a dict keyed by the ldap attribute, with a list
+        of the values for each entry (in the same order for every key).
+
+        If the ``ldap_attributes`` of the query are all attributes (``'*'``),
+        then the keys are all the attributes returned for the entries.  An
+        entry that does not have a value for an attribute gets an empty list.
+        The attribute names are matched case-insensitively, and the columns
+        are keyed by the requested names.
+
+        The columns can be converted to instances of a model with
+        :meth:`BaseModel.from_entry_batch`.
+
+        :param connection:  An optional :class:`ldap3.Connection` to use for the
+                            search.
+
+        :Example:
+
+            >>> columns = Query(model=User).all_soa()
+            >>> columns['uid']
+            [['testuser'], ['testuser2'], ...]
+            >>> User.from_entry_batch(columns)
+            (User(...), ...)
+
+        """
+        rows = [entry.entry_attributes_as_dict
+                for entry in self._query(connection)]
+        attrs = self.ldap_attributes
+        if attrs is None or ldap3.ALL_ATTRIBUTES in attrs:
+            attrs = OrderedDict.fromkeys(k for row in rows for k in row)
+        # ldap attribute names are case-insensitive, and the server's spelling
+        # is returned, which can differ from the requested one.
+        rows = [{k.lower(): v for (k, v) in row.items()} for row in rows]
+        return {attr: [row.get(attr.lower(), []) for row in rows]
+                for attr in attrs}
+
+    def compile(self, convert=True) -> Callable[..., Tuple[Any]]:
+        """Return a function that performs the search for the current state of
+        the query, returning a tuple of all the items found (like
+        :meth:`all`).
+
+        The ``search_base``, ``search_filter``, ``ldap_attributes`` and
+        ``model`` are looked up once, when compiled, so later changes to the
+        query are not reflected in the returned function.  This is useful for
+        queries that are performed often with the same criteria.  The
+        result cache is not used by the compiled function.
+
+        The returned function accepts an optional :class:`ldap3.Connection` to
+        use for the search, if not given then it uses the
+        :meth:`connection_ctx` of the query.
+
+        :param convert:  Whether to convert the :class:`ldap3.Entry`'s to the
+                         ``model`` set on a class.  Default is ``True``
+
+        :Example:
+
+            >>> active = Query(model=User).filter('(uid=*)').compile()
+            >>> active(connection)
+            (User(...), ...)
+
+        """
+        search_base = self.search_base
+        search_filter = self.search_filter
+        attributes = self.ldap_attributes
+        from_entry = None
+        if convert is True and self.model is not None:
+            from_entry = self.model.from_entry
+        page_size = self._page_size
+        connection_ctx = self.connection_ctx
+
+        def compiled(connection: ldap3.Connection=None) -> Tuple[Any]:
+            if connection is None:
+                with connection_ctx() as conn:
+                    if conn is None:
+                        return ()
+                    return compiled(conn)
+            entries = _search(connection, search_base, search_filter,
+                              attributes, page_size=page_size)
+            if from_entry is not None:
+                return tuple(map(from_entry, entries))
+            return tuple(entries)
+
+        return compiled
+
+    def in_(self, attr: str, values: Iterable[Any],
+            connection: ldap3.Connection=None) -> Dict[str, Any]:
+        """Look up the entries whose ``attr`` matches any of the ``values``
+        with a single search, instead of a search per value.  This returns a
+        dict of the found items, keyed by the requested values they match.
+
+        The values are compared case-insensitively with all of an entry's
+        values for the ``attr`` (like the server does for most attributes), so
+        an entry is found under every requested value it matches.  Values
+        that are not found are not in the returned dict.
+
+        The query is copied for the search, so the ``search_filter`` of an
+        instance is not changed.
+
+        :param attr:  The model's attribute name or the ldap entry key to
+                      match.
+        :param values:  The values to match.
+        :param connection:  An optional :class:`ldap3.Connection` to use for the
+                            search.
+
+        :Example:
+
+            >>> users = Query(model=User).in_('username', ('bob', 'alice'))
+            >>> users['bob']
+            User(...)
 
         """
-        entries = tuple(self._query(connection))
-        if len(entries) > 0:
-            if convert is True and self.model is not None:
-                return tuple(map(self.model.from_entry, entries))
-        return entries
+        values = tuple(values)
+        if len(values) == 0:
+            return {}
+
+        model = self.model
+        key = attr
+        if model is not None:
+            key = model.ldap_attribute_map().get(attr, attr)
+
+        query = copy.copy(self)
+        query.search_filter = _any_filter(key, values)
+        attrs = query.ldap_attributes
+        if attrs is not None and key not in attrs:
+            # make sure the server returns the values to key the results by.
+            query.ldap_attributes = attrs + (key, )
+
+        from_entry = None
+        if model is not None:
+            from_entry = model.from_entry
+
+        requested = {}
+        for value in values:
+            requested.setdefault(str(value).lower(), []).append(value)
+
+        lower_key = key.lower()
+        rv = {}
+        for entry in query.all(connection, convert=False):
+            attributes = entry.entry_attributes_as_dict
+            found = next((v for (k, v) in attributes.items()
+                          if k.lower() == lower_key), ())
+            matched = [req for value in found
+                       for req in requested.get(str(value).lower(), ())]
+            if len(matched) > 0:
+                if from_entry is not None:
+                    entry = from_entry(entry)
+                for value in matched:
+                    rv[value] = entry
+        return rv
 
     def __repr__(self) -> str:
-        rv = '{}('.format(self.__class__.__name__)
-        attrs = map(
-            lambda k: "{}={}".format(k, _quote_if_str(getattr(self, k, None))),
-            ('search_base', 'search_filter', 'ldap_attributes', 'connection',
-             'open_directory', 'model')
+        q = _quote_if_str
+        return (
+            '{}(search_base={}, search_filter={}, ldap_attributes={}, '
+            'connection={}, open_directory={}, model={})'.format(
+                type(self).__name__, q(self.search_base),
+                q(self.search_filter), q(self.ldap_attributes),
+                q(self.connection), q(self.open_directory), q(self.model)
+            )
         )
-        return rv + ', '.join(attrs) + ')'
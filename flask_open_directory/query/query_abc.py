@@ -12,6 +12,8 @@ class QueryABC(metaclass=abc.ABCMeta):
     an ``isinstance`` or ``issubclass`` check.
 
     """
+    __slots__ = ()
+
     @property
     @abc.abstractmethod
     def search_base(self) -> str:  # pragma: no cover
@@ -66,15 +68,11 @@ class QueryABC(metaclass=abc.ABCMeta):
 
     @classmethod
     def __subclasshook__(cls, Cls):
+        # ``ABCMeta`` caches the result of this hook for each class (with weak
+        # references), so the check only runs once per class.
         if cls is QueryABC:
-            methods = [
-                any('search_base' in dir(Base) for Base in Cls.__mro__),
-                any('search_filter' in dir(Base) for Base in Cls.__mro__),
-                any('connection' in dir(Base) for Base in Cls.__mro__),
-                any('ldap_attributes' in dir(Base) for Base in Cls.__mro__),
-                any('all' in dir(Base) for Base in Cls.__mro__),
-                any('first' in dir(Base) for Base in Cls.__mro__),
-            ]
-            if all(methods):
+            if all(hasattr(Cls, name) for name in (
+                    'search_base', 'search_filter', 'connection',
+                    'ldap_attributes', 'all', 'first')):
                 return True
         return NotImplemented
@@ -17,10 +17,8 @@ def base_dn_from_url(url: str) -> str:
 
     """
     if url:
-        parts = map(
-            lambda s: 'dc={}'.format(s),
-            (s for s in str(url).split('.') if s != '')
-        )
+        parts = map('dc={}'.format,
+                    (s for s in str(url).split('.') if s != ''))
         return ','.join(parts)
 
 
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from setuptools import setup
+from setuptools import setup, find_packages
 
 with open('README.rst') as readme_file:
     readme = readme_file.read()
@@ -27,15 +27,15 @@ setup(
     author="Michael Housh",
     author_email='mhoush@houshhomeenergy.com',
     url='https://github.com/m-housh/flask_open_directory',
-    packages=[
-        'flask_open_directory',
-    ],
+    packages=find_packages(include=['flask_open_directory',
+                                    'flask_open_directory.*']),
     package_dir={'flask_open_directory':
                  'flask_open_directory'},
     include_package_data=True,
     install_requires=requirements,
+    python_requires='>=3.5',
     license="MIT license",
-    zip_safe=False,
+    zip_safe=True,
     keywords='flask_open_directory',
     classifiers=[
         'Development Status :: 2 - Pre-Alpha',
@@ -70,3 +70,16 @@ def test_BaseOpenDirectory_connection_ctx(base_open_directory, flask_app):
     with flask_app.app_context() as ctx:
         with base_open_directory.connection_ctx() as conn:
             assert conn == ctx.open_directory_connection
+
+
+def test_BaseOpenDirectory_base_dn_is_cached():
+    od = BaseOpenDirectory(OPEN_DIRECTORY_SERVER='example.com')
+    assert od.server_url == 'example.com'
+    assert od.base_dn == 'dc=example,dc=com'
+
+    od.config['OPEN_DIRECTORY_SERVER'] = 'example.org'
+    assert od.base_dn == 'dc=example,dc=com'
+
+    od._invalidate()
+    assert od.server_url == 'example.org'
+    assert od.base_dn == 'dc=example,dc=org'
@@ -0,0 +1,77 @@
+import pytest
+from ldap3.core.exceptions import LDAPException
+
+from flask_open_directory import BaseOpenDirectory
+from flask_open_directory.base import ConnectionPool
+
+
+class FakeConnection(object):
+
+    def __init__(self):
+        self.bound = True
+
+    def unbind(self):
+        self.bound = False
+
+
+@pytest.fixture
+def pool():
+    return ConnectionPool(FakeConnection, size=2)
+
+
+def test_ConnectionPool_reuses_connections(pool):
+    conn = pool.get()
+    assert isinstance(conn, FakeConnection)
+    pool.put(conn)
+    assert pool.get() is conn
+
+
+def test_ConnectionPool_connection_ctx(pool):
+    with pool.connection() as conn:
+        assert isinstance(conn, FakeConnection)
+
+    with pool.connection() as conn2:
+        assert conn2 is conn
+
+
+def test_ConnectionPool_discards_when_full(pool):
+    conns = [pool.get() for _ in range(3)]
+    for c in conns:
+        pool.put(c)
+
+    assert conns[0].bound is True
+    assert conns[1].bound is True
+    assert conns[2].bound is False
+
+
+def test_ConnectionPool_discards_expired_connections():
+    pool = ConnectionPool(FakeConnection, lifetime=0)
+    conn = pool.get()
+    pool.put(conn)
+    assert conn.bound is False
+    assert pool.get() is not conn
+
+
+def test_ConnectionPool_discards_unbound_connections(pool):
+    conn = pool.get()
+    conn.bound = False
+    pool.put(conn)
+    assert pool.get() is not conn
+
+
+def test_ConnectionPool_discards_on_ldap_error(pool):
+    with pytest.raises(LDAPException):
+        with pool.connection() as conn:
+            raise LDAPException()
+
+    assert conn.bound is False
+    assert pool.get() is not conn
+
+
+def test_BaseOpenDirectory_pool():
+    od = BaseOpenDirectory(OPEN_DIRECTORY_POOL_SIZE=3,
+                           OPEN_DIRECTORY_POOL_LIFETIME=60)
+    assert isinstance(od.pool, ConnectionPool)
+    assert od.pool is od.pool
+    assert od.pool.size == 3
+    assert od.pool.lifetime == 60
@@ -1,6 +1,7 @@
 import pytest
 import os
 import base64
+import ldap3
 
 from flask_open_directory import OpenDirectory, Query, User, Group
 
@@ -73,6 +74,40 @@ def user_id(user_query, username):
     return user_query.filter(username=username).first().id
 
 
+@pytest.fixture
+def mock_connection():
+    """An :class:`ldap3.Connection` using the ``MOCK_SYNC`` strategy, with a
+    few user and group entries, for tests that don't need a real server.
+
+    """
+    connection = ldap3.Connection(ldap3.Server('example.com'),
+                                  client_strategy=ldap3.MOCK_SYNC)
+    base = 'cn=users,dc=example,dc=com'
+    connection.strategy.add_entry(base, {'objectClass': 'container'})
+    for uid, name in (('testuser', 'Test User'), ('testuser2', 'Test User2')):
+        connection.strategy.add_entry('uid={},{}'.format(uid, base), {
+            'uid': uid,
+            'cn': name,
+            'apple-generateduid': uid.upper(),
+            'objectClass': 'apple-user',
+        })
+
+    base = 'cn=groups,dc=example,dc=com'
+    connection.strategy.add_entry(base, {'objectClass': 'container'})
+    for names, uids in ((['admin', 'administrators'], ['testuser']),
+                        (['Staff'], ['testuser2']),
+                        (['odd*(name)'], ['testuser']),
+                        (['empty'], [])):
+        connection.strategy.add_entry('cn={},{}'.format(names[0], base), {
+            'cn': names,
+            'memberUid': uids,
+            'apple-group-memberguid': [uid.upper() for uid in uids],
+            'objectClass': 'apple-group',
+        })
+    connection.bind()
+    return connection
+
+
 @pytest.fixture
 def headers():
 
@@ -1,3 +1,5 @@
+import pytest
+from flask_open_directory.query import Query
 from flask_open_directory.model import BaseModel, User, Group, Attribute, \
     ModelABC
 
@@ -104,3 +106,188 @@ def test_Group_has_user(username, user_id):
 
     assert group.has_user(username)
     assert group.has_user(user_id)
+
+
+def test_BaseModel_attribute_map_is_cached():
+    assert User.ldap_attribute_map() is User.ldap_attribute_map()
+    assert User._reverse_attr_map['uid'] == 'username'
+    assert 'username' in User._attr_keys
+
+    class Admin(User):
+        level = Attribute('apple-admin-level')
+
+    assert Admin.attribute_for_key('uid') == User.username
+    assert Admin.ldap_attribute_map()['level'] == 'apple-admin-level'
+    assert 'level' not in User.ldap_attribute_map()
+    assert Admin(uid='admin').username == 'admin'
+
+
+def test_Attribute_descriptor():
+    assert isinstance(User.username, Attribute)
+    assert User.username.name == 'username'
+
+    u = User(uid='test', mail=['a@example.com', 'b@example.com'])
+    assert u.username == 'test'
+    assert u.email == ['a@example.com', 'b@example.com']
+    assert u.uid == 'test'
+
+    u.cn = 'Test User'
+    assert u.full_name == 'Test User'
+    assert u.ldap_values['full_name'] == 'Test User'
+
+    with pytest.raises(AttributeError):
+        u.invalid
+
+
+def test_BaseModel_from_entry():
+
+    class Entry(object):
+        entry_attributes_as_dict = {
+            'uid': ['test'],
+            'mail': ['test@example.com'],
+            'apple-generateduid': ['123'],
+            'objectClass': ['apple-user'],
+        }
+
+    u = User.from_entry(Entry())
+    assert isinstance(u, User)
+    assert u.username == 'test'
+    assert u.email == ['test@example.com']
+    assert u.id == '123'
+    assert u.full_name is None
+    assert 'objectClass' not in u.ldap_values
+
+
+def test_BaseModel_multi():
+    assert User._multi == frozenset(('email', ))
+    assert Group._multi == frozenset(('users', 'member_ids'))
+
+    g = Group(users=['a', 'b'], group_name=['test'])
+    assert g._get_ldap_value('users') == ['a', 'b']
+    assert g._get_ldap_value('group_name') == 'test'
+
+
+def test_BaseModel_repr_skips_unset_values():
+    assert repr(User()) == 'User()'
+    assert repr(User(uid=['test'])) == "User(username='test')"
+
+
+def test_BaseModel_from_entry_lazy():
+
+    class Entry(object):
+        calls = 0
+
+        @property
+        def entry_attributes_as_dict(self):
+            self.calls += 1
+            return {'uid': ['test'], 'cn': ['Test User']}
+
+    entry = Entry()
+    u = User.from_entry_lazy(entry)
+    assert isinstance(u, User)
+    assert entry.calls == 0
+
+    assert u.username == 'test'
+    assert u.full_name == 'Test User'
+    assert u.email is None
+    assert entry.calls == 1
+
+    u.username = 'changed'
+    assert u.username == 'changed'
+
+
+def test_BaseModel_from_entry_batch():
+    users = User.from_entry_batch({
+        'uid': [['a'], ['b']],
+        'full_name': ['A User', 'B User'],
+        'not-an-attribute': [1, 2],
+    })
+    assert len(users) == 2
+    assert users[0].username == 'a'
+    assert users[1].username == 'b'
+    assert users[1].full_name == 'B User'
+    assert users[0].email is None
+
+    assert len(User.from_entry_batch({'not-an-attribute': [1, 2]})) == 2
+    assert User.from_entry_batch({}) == ()
+
+
+def test_BaseModel_ldap_keys():
+    keys = User.ldap_keys()
+    assert isinstance(keys, tuple)
+    assert keys is User.ldap_keys()
+    assert set(keys) == {'apple-generateduid', 'uid', 'mail', 'cn'}
+
+
+def test_Group_has_user_members():
+    group = Group(users=['test1'], member_ids=['123'])
+    assert group.has_user('test1')
+    assert group.has_user('123')
+    assert not group.has_user('test2')
+
+    group.users = ['test2']
+    assert group.has_user('test2')
+    assert not group.has_user('test1')
+
+    group.users.append('test3')
+    assert group.has_user('test3')
+
+    assert Group(users='test1').has_user('test1')
+    assert not Group(users='test1').has_user('test')
+    assert not Group().has_user('test1')
+
+
+def test_Group_is_member(mock_connection):
+    query = Query(search_base='cn=groups,dc=example,dc=com',
+                  connection=mock_connection)
+
+    assert Group.is_member('admin', 'testuser', query) is True
+    assert Group.is_member('admin', 'TESTUSER', query) is True
+    # any of the group's names (cn) match.
+    assert Group.is_member('administrators', 'testuser', query) is True
+    assert Group.is_member('admin', 'testuser2', query) is False
+    assert Group.is_member('empty', 'testuser', query) is False
+    assert Group.is_member('missing', 'testuser', query) is False
+
+    # the values are escaped, not parsed as part of the filter.
+    assert Group.is_member('odd*(name)', 'testuser', query) is True
+    assert Group.is_member('odd*', 'testuser', query) is False
+    assert Group.is_member('admin', '*', query) is False
+
+    groups = Group.groups_for_user(('Administrators', 'staff', 'odd*(name)'),
+                                   'testuser', query)
+    assert sorted(g.group_name for g in groups) == ['admin', 'odd*(name)']
+
+
+def test_Group_groups_for_user_does_not_change_query():
+    query = Query(model=User)
+    assert Group.groups_for_user(('admin', ), 'bob', query) == ()
+    assert Group.is_member('admin', 'bob', query) is False
+
+    assert query.model is User
+    assert query.search_filter == query._default_search_filter
+    assert query.ldap_attributes == User.ldap_keys()
+
+
+def test_BaseModel_get_many(mock_connection):
+    query = Query(search_base='cn=users,dc=example,dc=com',
+                  connection=mock_connection)
+    users = User.get_many('username', ('testuser', 'testuser2'), query)
+    assert sorted(u.username for u in users) == ['testuser', 'testuser2']
+
+    assert query.model is None
+    assert query.search_filter == query._default_search_filter
+
+    assert User.get_many('username', (), query) == ()
+
+
+def test_User_attribute_name_for():
+    assert User.attribute_name_for('uid') == 'username'
+    assert User.attribute_name_for(User.email) == 'email'
+    assert User.attribute_name_for('invalid') is None
+
+
+def test_BaseModel_ldap_values_created_in_new():
+    u = User.__new__(User)
+    assert u.__dict__['_ldap_values'] == {}
+    assert u.ldap_values is u.ldap_values
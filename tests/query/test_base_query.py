@@ -1,5 +1,5 @@
 import pytest
-from flask_open_directory import BaseQuery, User
+from flask_open_directory import BaseQuery, User, Group
 from flask_open_directory.query.base_query import _quote_if_str
 
 import ldap3
@@ -169,3 +169,211 @@ def test_BaseQuery_repr(base_query, open_directory):
     assert "ldap_attributes=None" in r
     assert "BaseQuery(" in r
     assert ")" in r
+
+
+def test_BaseQuery_search_base_is_cached(base_query, open_directory):
+    assert base_query.search_base == open_directory.base_dn
+    assert base_query._cached_search_base == open_directory.base_dn
+
+    base_query.model = User
+    assert base_query.search_base == 'cn=users,' + open_directory.base_dn
+
+    base_query.search_base = 'dc=example,dc=com'
+    assert base_query.search_base == 'dc=example,dc=com'
+
+
+def test_BaseQuery_ldap_attributes_is_cached(base_query):
+    base_query.model = User
+    attrs = base_query.ldap_attributes
+    assert attrs == User.ldap_keys()
+    assert base_query.ldap_attributes is attrs
+
+    base_query.ldap_attributes = ['uid']
+    assert base_query.ldap_attributes == ('uid', )
+    assert base_query.ldap_attributes is base_query.ldap_attributes
+
+    base_query.ldap_attributes = 'cn'
+    assert base_query.ldap_attributes == ('cn', )
+
+
+def test_BaseQuery_cache(mock_connection):
+
+    class CachedQuery(BaseQuery):
+        __slots__ = ()
+        _cache_timeout = 60
+
+    query = CachedQuery(search_base='cn=users,dc=example,dc=com', model=User,
+                        search_filter='(uid=testuser)')
+    CachedQuery.invalidate_cache()
+    assert query.first(mock_connection).username == 'testuser'
+
+    mock_connection.strategy.remove_entry(
+        'uid=testuser,cn=users,dc=example,dc=com'
+    )
+    assert query.first(mock_connection).username == 'testuser'
+
+    CachedQuery.invalidate_cache()
+    assert query.first(mock_connection) is None
+
+
+def test_BaseQuery_cache_is_per_bind_identity(mock_connection):
+
+    class CachedQuery(BaseQuery):
+        __slots__ = ()
+        _cache_timeout = 60
+
+    admin = ldap3.Connection(ldap3.Server('example.com'),
+                             user='cn=admin,dc=example,dc=com',
+                             password='secret',
+                             client_strategy=ldap3.MOCK_SYNC)
+    admin.strategy.add_entry('cn=admin,dc=example,dc=com',
+                             {'userPassword': 'secret'})
+    admin.strategy.add_entry('uid=secret,cn=users,dc=example,dc=com', {
+        'uid': 'secret', 'objectClass': 'apple-user'
+    })
+    admin.bind()
+
+    query = CachedQuery(search_base='cn=users,dc=example,dc=com', model=User,
+                        search_filter='(uid=secret)')
+    CachedQuery.invalidate_cache()
+    assert query.first(admin).username == 'secret'
+    assert query.first(mock_connection) is None
+
+
+def test_BaseQuery_cache_stores_snapshots(mock_connection):
+
+    class CachedQuery(BaseQuery):
+        __slots__ = ()
+        _cache_timeout = 60
+
+    query = CachedQuery(search_base='cn=users,dc=example,dc=com', model=User,
+                        search_filter='(uid=testuser)')
+    CachedQuery.invalidate_cache()
+    entry = query.first(mock_connection, convert=False)
+    assert not isinstance(entry, ldap3.Entry)
+    assert entry.entry_dn == 'uid=testuser,cn=users,dc=example,dc=com'
+
+    # changing the values of a result does not change the cached values.
+    entry.entry_attributes_as_dict['uid'].append('changed')
+    query.first(mock_connection).ldap_values['username'].append('changed')
+    assert query.first(mock_connection, convert=False) \
+        .entry_attributes_as_dict['uid'] == ['testuser']
+    CachedQuery.invalidate_cache()
+
+
+def test_BaseQuery_in_(mock_connection):
+    query = BaseQuery(search_base='cn=users,dc=example,dc=com', model=User,
+                      search_filter='(uid=testuser)')
+    users = query.in_('username', ('testuser', 'testuser2', 'missing'),
+                      connection=mock_connection)
+
+    assert set(users.keys()) == {'testuser', 'testuser2'}
+    assert isinstance(users['testuser2'], User)
+    assert users['testuser2'].username == 'testuser2'
+    # the instance's filter is left alone
+    assert query.search_filter == '(uid=testuser)'
+    assert query.in_('username', ()) == {}
+
+    query.ldap_attributes = ['cn']
+    users = query.in_('uid', ('testuser', ), connection=mock_connection)
+    assert list(users.keys()) == ['testuser']
+
+
+def test_BaseQuery_in_matches_requested_values(mock_connection):
+    query = BaseQuery(search_base='cn=groups,dc=example,dc=com', model=Group)
+    groups = query.in_('group_name', ['administrators', 'staff', 'ADMIN',
+                                      'missing'], connection=mock_connection)
+
+    assert set(groups.keys()) == {'administrators', 'staff', 'ADMIN'}
+    assert groups['administrators'] is groups['ADMIN']
+    assert groups['administrators'].group_name == 'admin'
+    assert groups['staff'].group_name == 'Staff'
+
+
+def test_BaseQuery_query_does_not_set_connection(mock_connection):
+    query = BaseQuery(search_base='cn=users,dc=example,dc=com', model=User,
+                      search_filter='(uid=testuser)')
+    assert query.first(mock_connection).username == 'testuser'
+    assert query.connection is None
+
+
+def test_BaseQuery_slots():
+    query = BaseQuery()
+    assert not hasattr(query, '__dict__')
+    with pytest.raises(AttributeError):
+        query.not_a_slot = 'value'
+
+
+def test_BaseQuery_compile(mock_connection):
+    query = BaseQuery(search_base='cn=users,dc=example,dc=com', model=User,
+                      search_filter='(uid=testuser)')
+    compiled = query.compile()
+    query.search_filter = '(uid=testuser2)'
+
+    users = compiled(mock_connection)
+    assert len(users) == 1
+    assert users[0].username == 'testuser'
+
+    entries = query.compile(convert=False)(mock_connection)
+    assert isinstance(entries[0], ldap3.Entry)
+
+    assert BaseQuery().compile()() == ()
+
+
+def test_BaseQuery_paged_search(mock_connection):
+
+    class PagedQuery(BaseQuery):
+        __slots__ = ()
+        _page_size = 1
+
+    query = PagedQuery(search_base='cn=users,dc=example,dc=com', model=User,
+                       search_filter='(uid=*)')
+    users = query.all(mock_connection)
+    assert sorted(u.username for u in users) == ['testuser', 'testuser2']
+    assert len(query.compile()(mock_connection)) == 2
+
+
+def test_BaseQuery_paged_search_with_nested_search(mock_connection):
+
+    class PagedQuery(BaseQuery):
+        __slots__ = ()
+        _page_size = 1
+
+    query = PagedQuery(search_base='cn=groups,dc=example,dc=com',
+                       model=Group, search_filter='(objectClass=apple-group)')
+    lookup = BaseQuery(search_base='cn=users,dc=example,dc=com', model=User,
+                       search_filter='(uid=testuser)')
+
+    names = []
+    for entry in query._query(mock_connection):
+        # another search on the same connection during the paged search.
+        assert lookup.first(mock_connection).username == 'testuser'
+        names.append(entry.entry_attributes_as_dict['cn'][0])
+    assert sorted(names) == ['Staff', 'admin', 'empty', 'odd*(name)']
+
+
+def test_BaseQuery_all_soa(mock_connection):
+    query = BaseQuery(search_base='cn=users,dc=example,dc=com', model=User,
+                      search_filter='(uid=*)', ldap_attributes=('uid', 'cn'))
+    columns = query.all_soa(mock_connection)
+    assert set(columns.keys()) == {'uid', 'cn'}
+    assert sorted(columns['uid']) == [['testuser'], ['testuser2']]
+
+    users = User.from_entry_batch(columns)
+    assert sorted(u.username for u in users) == ['testuser', 'testuser2']
+    assert all(isinstance(u, User) for u in users)
+
+    query = BaseQuery(search_base='cn=users,dc=example,dc=com',
+                      search_filter='(uid=testuser)',
+                      ldap_attributes=ldap3.ALL_ATTRIBUTES)
+    columns = query.all_soa(mock_connection)
+    assert columns['apple-generateduid'] == [['TESTUSER']]
+
+
+def test_BaseQuery_all_soa_attribute_names_are_case_insensitive(
+        mock_connection):
+    query = BaseQuery(search_base='cn=groups,dc=example,dc=com',
+                      search_filter='(cn=Staff)',
+                      ldap_attributes=('CN', 'memberuid'))
+    columns = query.all_soa(mock_connection)
+    assert columns == {'CN': [['Staff']], 'memberuid': [['testuser2']]}
@@ -41,3 +41,39 @@ def test_calling_an_instance_updates_model(user_query):
 
 def test_calling_an_instance_is_chainable(user_query):
     assert user_query(Group) == user_query
+
+
+def test_Query_only(user_query):
+    assert user_query.ldap_attributes == User.ldap_keys()
+
+    assert user_query.only('username', 'mail') == user_query
+    assert user_query.ldap_attributes == ('uid', 'mail')
+
+    q = Query().only('cn')
+    assert q.ldap_attributes == ('cn', )
+
+
+def test_Query_filter_in(user_query):
+    assert user_query.filter_in('username', ('a', 'b')) == user_query
+    assert user_query.search_filter == '(|(uid=a)(uid=b))'
+
+    user_query.filter_in('cn', ['Test User'])
+    assert user_query.search_filter == '(cn=Test User)'
+
+    user_query.filter_in('uid', ['a*'])
+    assert user_query.search_filter == '(uid=a\\2a)'
+
+    with pytest.raises(ValueError):
+        user_query.filter_in('uid', [])
+    assert user_query.search_filter == '(uid=a\\2a)'
+
+
+def test_Query_has_no_instance_dict(user_query):
+    assert not hasattr(user_query, '__dict__')
+
+
+def test_Query_filter_string_from_kwargs(user_query):
+    assert user_query._filter_string_from_kwargs({}) is None
+    assert user_query._filter_string_from_kwargs({'email': 'a'}) == '(mail=a)'
+    assert user_query._filter_string_from_kwargs({'objectClass': 'x'}) == \
+        '(objectClass=x)'
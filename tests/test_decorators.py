@@ -1,5 +1,6 @@
 import pytest
 from flask import Flask
+from flask_open_directory import Group
 from flask_open_directory.decorators import requires_group, DecoratorContext, \
     requires_all_groups, requires_any_group
 
@@ -105,3 +106,43 @@ def test_requires_any_group_decorator(group_name, username, headers, flask_app,
                            headers=headers(workgroup_username, 'pass'))
     assert resp.status_code == 200
     assert b"Hello from restricted" in resp.data
+
+
+def test_group_membership_is_cached_for_the_request(flask_app, headers,
+                                                    monkeypatch):
+    searched = []
+
+    def groups_for_user(group_names, user, query):
+        searched.append(tuple(group_names))
+        return (Group(group_name='admins'), )
+
+    monkeypatch.setattr(Group, 'groups_for_user', groups_for_user)
+
+    @flask_app.route('/restricted')
+    @requires_group('admins')
+    @requires_any_group('Admins', 'office')
+    def restricted():
+        return "Hello from restricted."
+
+    test_client = flask_app.test_client()
+    resp = test_client.get('/restricted', headers=headers('user', 'pass'))
+    assert resp.status_code == 200
+    assert searched == [('admins', ), ('office', )]
+
+
+def test_group_membership_matches_any_group_name(flask_app, headers,
+                                                 monkeypatch):
+
+    def groups_for_user(group_names, user, query):
+        return (Group(group_name=['admin', 'Administrators']), )
+
+    monkeypatch.setattr(Group, 'groups_for_user', groups_for_user)
+
+    @flask_app.route('/restricted')
+    @requires_group('administrators')
+    def restricted():
+        return "Hello from restricted."
+
+    test_client = flask_app.test_client()
+    resp = test_client.get('/restricted', headers=headers('user', 'pass'))
+    assert resp.status_code == 200
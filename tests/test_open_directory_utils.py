@@ -38,3 +38,38 @@ def test_init_with_flask_app(flask_app):
     assert od_no_app.app is None
     od_no_app.init_app(flask_app)
     assert od_no_app.app is None
+
+
+def test_init_app_updates_base_dn(flask_app):
+    od = OpenDirectory()
+    od.config['OPEN_DIRECTORY_BASE_DN'] = None
+    assert od.server_url != 'example.com'
+
+    flask_app.config['OPEN_DIRECTORY_SERVER'] = 'example.com'
+    od.init_app(flask_app)
+    assert od.server_url == 'example.com'
+    assert od.base_dn == 'dc=example,dc=com'
+
+
+def test_teardown_returns_connection_to_pool(flask_app):
+
+    class FakeConnection(object):
+        bound = True
+
+        def unbind(self):  # pragma: no cover
+            pass
+
+    class FakeOpenDirectory(OpenDirectory):
+
+        def connect(self):
+            return FakeConnection()
+
+    od = FakeOpenDirectory(flask_app)
+
+    with flask_app.app_context() as ctx:
+        conn = od.connection
+        assert od.connection is conn
+        assert ctx.open_directory_connection is conn
+
+    assert not hasattr(ctx, 'open_directory_connection')
+    assert od.pool.get() is conn